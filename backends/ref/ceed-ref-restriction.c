@@ -16,20 +16,22 @@
 
 #include "ceed-ref.h"
 
+// Core restriction kernel; ncomp and blksize are passed as compile-time
+//   constants by the specialized wrappers below to allow unrolling and
+//   vectorization of the inner loops
 static inline int CeedElemRestrictionApply_Ref_Core(CeedElemRestriction r,
-    CeedInt start, CeedInt stop, CeedTransposeMode tmode,
-    CeedTransposeMode lmode, CeedVector u, CeedVector v, CeedRequest *request) {
+    const CeedInt ncomp, const CeedInt blksize, CeedInt start, CeedInt stop,
+    CeedTransposeMode tmode, CeedTransposeMode lmode, CeedVector u,
+    CeedVector v, CeedRequest *request) {
   int ierr;
   CeedElemRestriction_Ref *impl;
   ierr = CeedElemRestrictionGetData(r, (void *)&impl); CeedChk(ierr);;
   const CeedScalar *uu;
   CeedScalar *vv;
-  CeedInt blksize, nelem, elemsize, nnodes, ncomp, voffset;
-  ierr = CeedElemRestrictionGetBlockSize(r, &blksize); CeedChk(ierr);
+  CeedInt nelem, elemsize, nnodes, voffset;
   ierr = CeedElemRestrictionGetNumElements(r, &nelem); CeedChk(ierr);
   ierr = CeedElemRestrictionGetElementSize(r, &elemsize); CeedChk(ierr);
   ierr = CeedElemRestrictionGetNumNodes(r, &nnodes); CeedChk(ierr);
-  ierr = CeedElemRestrictionGetNumComponents(r, &ncomp); CeedChk(ierr);
   voffset = start*blksize*elemsize*ncomp;
 
   ierr = CeedVectorGetArrayRead(u, CEED_MEM_HOST, &uu); CeedChk(ierr);
@@ -89,22 +91,73 @@ static inline int CeedElemRestrictionApply_Ref_Core(CeedElemRestriction r,
   return 0;
 }
 
+static int CeedElemRestrictionApply_Ref_11(CeedElemRestriction r,
+    const CeedInt ncomp, const CeedInt blksize, CeedInt start, CeedInt stop,
+    CeedTransposeMode tmode, CeedTransposeMode lmode, CeedVector u,
+    CeedVector v, CeedRequest *request) {
+  return CeedElemRestrictionApply_Ref_Core(r, 1, 1, start, stop, tmode, lmode,
+         u, v, request);
+}
+
+static int CeedElemRestrictionApply_Ref_18(CeedElemRestriction r,
+    const CeedInt ncomp, const CeedInt blksize, CeedInt start, CeedInt stop,
+    CeedTransposeMode tmode, CeedTransposeMode lmode, CeedVector u,
+    CeedVector v, CeedRequest *request) {
+  return CeedElemRestrictionApply_Ref_Core(r, 1, 8, start, stop, tmode, lmode,
+         u, v, request);
+}
+
+static int CeedElemRestrictionApply_Ref_31(CeedElemRestriction r,
+    const CeedInt ncomp, const CeedInt blksize, CeedInt start, CeedInt stop,
+    CeedTransposeMode tmode, CeedTransposeMode lmode, CeedVector u,
+    CeedVector v, CeedRequest *request) {
+  return CeedElemRestrictionApply_Ref_Core(r, 3, 1, start, stop, tmode, lmode,
+         u, v, request);
+}
+
+static int CeedElemRestrictionApply_Ref_38(CeedElemRestriction r,
+    const CeedInt ncomp, const CeedInt blksize, CeedInt start, CeedInt stop,
+    CeedTransposeMode tmode, CeedTransposeMode lmode, CeedVector u,
+    CeedVector v, CeedRequest *request) {
+  return CeedElemRestrictionApply_Ref_Core(r, 3, 8, start, stop, tmode, lmode,
+         u, v, request);
+}
+
+static int CeedElemRestrictionApply_Ref_X(CeedElemRestriction r,
+    const CeedInt ncomp, const CeedInt blksize, CeedInt start, CeedInt stop,
+    CeedTransposeMode tmode, CeedTransposeMode lmode, CeedVector u,
+    CeedVector v, CeedRequest *request) {
+  return CeedElemRestrictionApply_Ref_Core(r, ncomp, blksize, start, stop,
+         tmode, lmode, u, v, request);
+}
+
 static int CeedElemRestrictionApply_Ref(CeedElemRestriction r,
                                         CeedTransposeMode tmode,
                                         CeedTransposeMode lmode, CeedVector u,
                                         CeedVector v, CeedRequest *request) {
   int ierr;
-  CeedInt nblk;
+  CeedInt nblk, ncomp, blksize;
   ierr = CeedElemRestrictionGetNumBlocks(r, &nblk); CeedChk(ierr);
-  return  CeedElemRestrictionApply_Ref_Core(r, 0, nblk, tmode, lmode, u, v,
-          request);
+  ierr = CeedElemRestrictionGetNumComponents(r, &ncomp); CeedChk(ierr);
+  ierr = CeedElemRestrictionGetBlockSize(r, &blksize); CeedChk(ierr);
+  CeedElemRestriction_Ref *impl;
+  ierr = CeedElemRestrictionGetData(r, (void *)&impl); CeedChk(ierr);
+
+  return impl->Apply(r, ncomp, blksize, 0, nblk, tmode, lmode, u, v, request);
 }
 
 static int CeedElemRestrictionApplyBlock_Ref(CeedElemRestriction r,
     CeedInt block, CeedTransposeMode tmode, CeedTransposeMode lmode,
     CeedVector u, CeedVector v, CeedRequest *request) {
-  return CeedElemRestrictionApply_Ref_Core(r, block, block+1, tmode, lmode, u,
-         v, request);
+  int ierr;
+  CeedInt ncomp, blksize;
+  ierr = CeedElemRestrictionGetNumComponents(r, &ncomp); CeedChk(ierr);
+  ierr = CeedElemRestrictionGetBlockSize(r, &blksize); CeedChk(ierr);
+  CeedElemRestriction_Ref *impl;
+  ierr = CeedElemRestrictionGetData(r, (void *)&impl); CeedChk(ierr);
+
+  return impl->Apply(r, ncomp, blksize, block, block+1, tmode, lmode, u, v,
+                     request);
 }
 
 static int CeedElemRestrictionDestroy_Ref(CeedElemRestriction r) {
@@ -121,9 +174,11 @@ int CeedElemRestrictionCreate_Ref(CeedMemType mtype, CeedCopyMode cmode,
                                   const CeedInt *indices, CeedElemRestriction r) {
   int ierr;
   CeedElemRestriction_Ref *impl;
-  CeedInt elemsize, nelem;
+  CeedInt elemsize, nelem, ncomp, blksize;
   ierr = CeedElemRestrictionGetNumElements(r, &nelem); CeedChk(ierr);
   ierr = CeedElemRestrictionGetElementSize(r, &elemsize); CeedChk(ierr);
+  ierr = CeedElemRestrictionGetNumComponents(r, &ncomp); CeedChk(ierr);
+  ierr = CeedElemRestrictionGetBlockSize(r, &blksize); CeedChk(ierr);
   Ceed ceed;
   ierr = CeedElemRestrictionGetCeed(r, &ceed); CeedChk(ierr);
 
@@ -148,6 +203,28 @@ int CeedElemRestrictionCreate_Ref(CeedMemType mtype, CeedCopyMode cmode,
     impl->indices = indices;
   }
 
+  // Choose specialized kernel for common component and block sizes
+  CeedInt idx = -1;
+  if (blksize < 10)
+    idx = 10*ncomp + blksize;
+  switch (idx) {
+  case 11:
+    impl->Apply = CeedElemRestrictionApply_Ref_11;
+    break;
+  case 18:
+    impl->Apply = CeedElemRestrictionApply_Ref_18;
+    break;
+  case 31:
+    impl->Apply = CeedElemRestrictionApply_Ref_31;
+    break;
+  case 38:
+    impl->Apply = CeedElemRestrictionApply_Ref_38;
+    break;
+  default:
+    impl->Apply = CeedElemRestrictionApply_Ref_X;
+    break;
+  }
+
   ierr = CeedElemRestrictionSetData(r, (void *)&impl); CeedChk(ierr);
   ierr = CeedSetBackendFunction(ceed, "ElemRestriction", r, "Apply",
                                 CeedElemRestrictionApply_Ref); CeedChk(ierr);
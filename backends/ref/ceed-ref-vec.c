@@ -30,18 +30,22 @@ static int CeedVectorSetArray_Ref(CeedVector vec, CeedMemType mtype,
     // LCOV_EXCL_START
     return CeedError(ceed, 1, "Only MemType = HOST supported");
   // LCOV_EXCL_STOP
-  ierr = CeedFree(&impl->array_allocated); CeedChk(ierr);
   switch (cmode) {
   case CEED_COPY_VALUES:
-    ierr = CeedMalloc(length, &impl->array_allocated); CeedChk(ierr);
+    // Reuse owned array, if present, to avoid reallocating on repeated copies
+    if (!impl->array_allocated) {
+      ierr = CeedMalloc(length, &impl->array_allocated); CeedChk(ierr);
+    }
     impl->array = impl->array_allocated;
     if (array) memcpy(impl->array, array, length * sizeof(array[0]));
     break;
   case CEED_OWN_POINTER:
+    ierr = CeedFree(&impl->array_allocated); CeedChk(ierr);
     impl->array_allocated = array;
     impl->array = array;
     break;
   case CEED_USE_POINTER:
+    ierr = CeedFree(&impl->array_allocated); CeedChk(ierr);
     impl->array = array;
   }
   return 0;
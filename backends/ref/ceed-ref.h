@@ -31,6 +31,9 @@ typedef struct {
 typedef struct {
   const CeedInt *indices;
   CeedInt *indices_allocated;
+  int (*Apply)(CeedElemRestriction, const CeedInt, const CeedInt, CeedInt,
+               CeedInt, CeedTransposeMode, CeedTransposeMode, CeedVector,
+               CeedVector, CeedRequest *);
 } CeedElemRestriction_Ref;
 
 typedef struct {
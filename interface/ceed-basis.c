@@ -1267,8 +1267,10 @@ int CeedBasisGetTopologyDimension(CeedElemTopology topo, CeedInt *dim) {
 int CeedBasisDestroy(CeedBasis *basis) {
   int ierr;
 
-  if (!*basis || --(*basis)->refcount > 0)
+  if (!*basis || --(*basis)->refcount > 0) {
+    *basis = NULL;
     return 0;
+  }
   if ((*basis)->Destroy) {
     ierr = (*basis)->Destroy(*basis); CeedChk(ierr);
   }
@@ -399,7 +399,8 @@ int CeedElemRestrictionApplyBlock(CeedElemRestriction rstr, CeedInt block,
   @brief Get the multiplicity of nodes in a CeedElemRestriction
 
   @param rstr      CeedElemRestriction
-  @param[out] mult Vector to store multiplicity (of size nnodes)
+  @param[out] mult Vector to store multiplicity (of size nnodes); any
+                     previous values are overwritten, so it need not be zeroed
 
   @return An error code: 0 - success, otherwise - failure
 
@@ -413,6 +414,7 @@ int CeedElemRestrictionGetMultiplicity(CeedElemRestriction rstr,
   // Create and set evec
   ierr = CeedElemRestrictionCreateVector(rstr, NULL, &evec); CeedChk(ierr);
   ierr = CeedVectorSetValue(evec, 1.0); CeedChk(ierr);
+  ierr = CeedVectorSetValue(mult, 0.0); CeedChk(ierr);
 
   // Apply to get multiplicity
   ierr = CeedElemRestrictionApply(rstr, CEED_TRANSPOSE, CEED_NOTRANSPOSE, evec,
@@ -596,8 +598,10 @@ int CeedElemRestrictionView(CeedElemRestriction rstr, FILE *stream) {
 int CeedElemRestrictionDestroy(CeedElemRestriction *rstr) {
   int ierr;
 
-  if (!*rstr || --(*rstr)->refcount > 0)
+  if (!*rstr || --(*rstr)->refcount > 0) {
+    *rstr = NULL;
     return 0;
+  }
   if ((*rstr)->Destroy) {
     ierr = (*rstr)->Destroy(*rstr); CeedChk(ierr);
   }
@@ -864,11 +864,13 @@ int CeedOperatorFieldGetVector(CeedOperatorField opfield, CeedVector *vec) {
 int CeedOperatorDestroy(CeedOperator *op) {
   int ierr;
 
-  if (!*op || --(*op)->refcount > 0) return 0;
+  if (!*op || --(*op)->refcount > 0) {
+    *op = NULL;
+    return 0;
+  }
   if ((*op)->Destroy) {
     ierr = (*op)->Destroy(*op); CeedChk(ierr);
   }
-  ierr = CeedDestroy(&(*op)->ceed); CeedChk(ierr);
   // Free fields
   for (int i=0; i<(*op)->nfields; i++)
     if ((*op)->inputfields[i]) {
@@ -908,6 +910,7 @@ int CeedOperatorDestroy(CeedOperator *op) {
   ierr = CeedFree(&(*op)->inputfields); CeedChk(ierr);
   ierr = CeedFree(&(*op)->outputfields); CeedChk(ierr);
   ierr = CeedFree(&(*op)->suboperators); CeedChk(ierr);
+  ierr = CeedDestroy(&(*op)->ceed); CeedChk(ierr);
   ierr = CeedFree(op); CeedChk(ierr);
   return 0;
 }
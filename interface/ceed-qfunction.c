@@ -638,8 +638,10 @@ int CeedQFunctionFieldGetEvalMode(CeedQFunctionField qffield,
 int CeedQFunctionDestroy(CeedQFunction *qf) {
   int ierr;
 
-  if (!*qf || --(*qf)->refcount > 0)
+  if (!*qf || --(*qf)->refcount > 0) {
+    *qf = NULL;
     return 0;
+  }
   // Backend destroy
   if ((*qf)->Destroy) {
     ierr = (*qf)->Destroy(*qf); CeedChk(ierr);
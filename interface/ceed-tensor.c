@@ -156,8 +156,10 @@ int CeedTensorContractSetData(CeedTensorContract contract, void **data) {
 int CeedTensorContractDestroy(CeedTensorContract *contract) {
   int ierr;
 
-  if (!*contract || --(*contract)->refcount > 0)
+  if (!*contract || --(*contract)->refcount > 0) {
+    *contract = NULL;
     return 0;
+  }
   if ((*contract)->Destroy) {
     ierr = (*contract)->Destroy(*contract); CeedChk(ierr);
   }
@@ -412,8 +412,10 @@ int CeedVectorAddReference(CeedVector vec) {
 int CeedVectorDestroy(CeedVector *vec) {
   int ierr;
 
-  if (!*vec || --(*vec)->refcount > 0)
+  if (!*vec || --(*vec)->refcount > 0) {
+    *vec = NULL;
     return 0;
+  }
 
   if ((*vec) && ((*vec)->state % 2) == 1)
     return CeedError((*vec)->ceed, 1, "Cannot destroy CeedVector, the access "
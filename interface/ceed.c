@@ -669,8 +669,10 @@ int CeedGetResource(Ceed ceed, const char **resource) {
 int CeedDestroy(Ceed *ceed) {
   int ierr;
 
-  if (!*ceed || --(*ceed)->refcount > 0)
+  if (!*ceed || --(*ceed)->refcount > 0) {
+    *ceed = NULL;
     return 0;
+  }
   if ((*ceed)->delegate) {
     ierr = CeedDestroy(&(*ceed)->delegate); CeedChk(ierr);
   }
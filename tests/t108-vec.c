@@ -0,0 +1,41 @@
+/// @file
+/// Test refreshing a vector with repeated CEED_COPY_VALUES
+/// \test Test refreshing a vector with repeated CEED_COPY_VALUES
+#include <ceed.h>
+
+int main(int argc, char **argv) {
+  Ceed ceed;
+  CeedVector x;
+  CeedInt n;
+  CeedScalar a[10];
+  const CeedScalar *b;
+
+  CeedInit(argv[1], &ceed);
+
+  n = 10;
+  CeedVectorCreate(ceed, n, &x);
+
+  for (CeedInt i=0; i<n; i++)
+    a[i] = 10 + i;
+  CeedVectorSetArray(x, CEED_MEM_HOST, CEED_COPY_VALUES, a);
+
+  // Copy new values into the array owned by the vector
+  for (CeedInt i=0; i<n; i++)
+    a[i] = 20 + i;
+  CeedVectorSetArray(x, CEED_MEM_HOST, CEED_COPY_VALUES, a);
+
+  for (CeedInt i=0; i<n; i++)
+    a[i] = 0;
+
+  CeedVectorGetArrayRead(x, CEED_MEM_HOST, &b);
+  for (CeedInt i=0; i<n; i++)
+    if (b[i] != 20+i)
+      // LCOV_EXCL_START
+      printf("Error reading array b[%d] = %f",i,(double)b[i]);
+  // LCOV_EXCL_STOP
+  CeedVectorRestoreArrayRead(x, &b);
+
+  CeedVectorDestroy(&x);
+  CeedDestroy(&ceed);
+  return 0;
+}
@@ -23,7 +23,7 @@
       call ceedinit(trim(arg)//char(0),ceed,err)
 
       call ceedvectorcreate(ceed,3*ne+1,mult,err)
-      call ceedvectorsetvalue(mult,0.d0,err);
+      call ceedvectorsetvalue(mult,1.d0,err);
 
       do i=1,ne
         ind(4*i-3)=3*i-3
@@ -14,7 +14,7 @@ int main(int argc, char **argv) {
   CeedInit(argv[1], &ceed);
 
   CeedVectorCreate(ceed, 3*ne+1, &mult);
-  CeedVectorSetValue(mult, 0); // Allocates array
+  CeedVectorSetValue(mult, 1); // Overwritten by GetMultiplicity
 
   for (CeedInt i=0; i<ne; i++) {
     ind[4*i+0] = i*3+0;